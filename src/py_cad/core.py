@@ -7,8 +7,9 @@ automatic attribute normalization, inheritance, and dynamic builder/assembler re
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from enum import StrEnum
+from types import MappingProxyType
 from typing import Any
 
 import cadquery as cq
@@ -30,7 +31,13 @@ class BasicDimensionData(metaclass=_PostInitMeta):
     x_len: int | float
     y_len: int | float
     z_len: int | float
-    _has_basic_dimensions: bool
+
+    # Class-level defaults, so __setattr__ can read the flags directly even before __init__
+    # runs (subclasses may set attributes before calling super). An instance only gets its
+    # own entry once a value differs from the default.
+    _freeze_existing_attributes: bool = False
+    _has_basic_dimensions: bool = False
+    _repr_cache: str | None = None
 
     def __init__(
         self,
@@ -44,22 +51,19 @@ class BasicDimensionData(metaclass=_PostInitMeta):
         This allows for flexible initialization and subclassing.
         """
 
-        # Initialized to False. Can be changed in _post_init or by freeze_existing_attributes().
-        self._freeze_existing_attributes = False
-
         if basic_dimensions is not None:
             self.set_basic_dimensions(basic_dimensions, **extra_dimensions)
         else:
-            self._has_basic_dimensions = False
             self.update(**extra_dimensions)
 
-        # Temp attribute to trigger freeze_existing_attributes in _post_init
-        self._freeze = freeze
+        # Temp attribute to trigger freeze_existing_attributes in _post_init. Framework flags
+        # are set with object.__setattr__, so they bypass the freeze check in __setattr__.
+        object.__setattr__(self, "_freeze", freeze)
 
     def _post_init(self, *args, **kwargs) -> None:
-        if self._freeze:
+        # Removed again so that no scratch attribute stays on the instance.
+        if self.__dict__.pop("_freeze"):
             self.freeze_existing_attributes()
-            delattr(self, "_freeze")
 
     def update(self, **extra_dimensions: Any):
         """
@@ -89,35 +93,49 @@ class BasicDimensionData(metaclass=_PostInitMeta):
         x_len, y_len, z_len = basic_dimensions
         # Basic dimensions come last to take priority over extra dimensions.
         self.update(x_len=x_len, y_len=y_len, z_len=z_len)
-        self._has_basic_dimensions = True
+        # Framework flags are never frozen: set them without the __setattr__ guard.
+        object.__setattr__(self, "_has_basic_dimensions", True)
 
     def freeze_existing_attributes(self):
         """Freeze existing attributes to prevent modification."""
         if not self._has_basic_dimensions:
             raise ValueError("Cannot freeze existing attributes before setting basic dimensions.")
-        self._freeze_existing_attributes = True
+        object.__setattr__(self, "_freeze_existing_attributes", True)
 
     def __setattr__(self, name, value):
-        """Allow setting anything if not frozen or if setting _freeze_existing_attributes itself"""
-        if (
-            getattr(self, "_freeze_existing_attributes", False)
-            and name != "_freeze_existing_attributes"
-        ):
+        """Allow setting anything if not frozen. If frozen, only new attributes may be added."""
+        if self._freeze_existing_attributes:
             if name in self.__dict__:
                 raise AttributeError(
                     f"Attributes of {self.__class__.__name__} instances "
                     "are immutable after freeze_existing_attributes() has been called."
                 )
+            # A new attribute changes the repr. Dropping the entry restores the class default.
+            self.__dict__.pop("_repr_cache", None)
         super().__setattr__(name, value)
 
+    def __delattr__(self, name):
+        self.__dict__.pop("_repr_cache", None)
+        super().__delattr__(name)
+
     def __repr__(self):
+        """
+        Once frozen, existing attributes cannot be rebound, so the repr is computed once and
+        cached (reset if attributes are added or deleted). Note that in-place mutation of a
+        mutable attribute value (e.g. a dict) after freezing is not reflected.
+        """
+        if self._repr_cache is not None:
+            return self._repr_cache
         attrs = []
         for attr, value in self.__dict__.items():
             if attr.startswith("_") or callable(value):
                 continue
             attrs.append(f"{attr}={value!r}")
         attrs.sort()  # Sort attributes for consistent output
-        return f"{self.__class__.__name__}({', '.join(attrs)})"
+        text = f"{self.__class__.__name__}({', '.join(attrs)})"
+        if self._freeze_existing_attributes:
+            object.__setattr__(self, "_repr_cache", text)
+        return text
 
 
 class DimensionData(BasicDimensionData):
@@ -176,30 +194,46 @@ class DimensionData(BasicDimensionData):
                 )
 
             for part_type, val in dict_val.items():
-                basic_dim_data = self._part_types_dimensions.setdefault(
-                    part_type, BasicDimensionData(freeze=False)
-                )
-                setattr(basic_dim_data, attr, val)
+                setattr(self._get_or_add_part_type_dimensions(part_type), attr, val)
 
     def _post_init(self, *args, **kwargs):
         self._add_part_types_dimensions()
         # super init placed last since it calls freeze_existing_attributes
         super()._post_init(*args, **kwargs)
 
+    def _get_or_add_part_type_dimensions(self, part_type: str) -> BasicDimensionData:
+        """
+        Return the (unfrozen) BasicDimensionData for part_type, creating it if missing.
+        Unlike dict.setdefault, no throwaway instance is constructed when it already exists.
+        """
+        basic_dim_data = self._part_types_dimensions.get(part_type)
+        if basic_dim_data is None:
+            basic_dim_data = BasicDimensionData(freeze=False)
+            self._part_types_dimensions[part_type] = basic_dim_data
+        return basic_dim_data
+
     def _add_part_types_dimensions(self) -> None:
-        new_part_types_dimensions = NormalizedDict(**self.get_part_types_dimensions())
-        for part_type, dimensions in new_part_types_dimensions.items():
-            basic_dim_data: BasicDimensionData = self._part_types_dimensions.setdefault(
-                part_type, BasicDimensionData(freeze=False)
+        part_types_dimensions = self.get_part_types_dimensions()
+        # Only a mapping is accepted, as with the ** unpacking this replaced.
+        if not isinstance(part_types_dimensions, Mapping):
+            raise TypeError(
+                f"{type(self).__name__}.get_part_types_dimensions must return a mapping, "
+                f"got {type(part_types_dimensions).__name__}."
             )
+        new_part_types_dimensions = NormalizedDict(part_types_dimensions)
+        for part_type, dimensions in new_part_types_dimensions.items():
+            basic_dim_data = self._get_or_add_part_type_dimensions(part_type)
             basic_dims, extra_dims = self._normalize_part_type_dimensions(dimensions)
             basic_dim_data.set_basic_dimensions(basic_dims, **extra_dims)
             basic_dim_data.freeze_existing_attributes()
 
     @property
-    def part_types_dimensions(self) -> NormalizedDict[str, BasicDimensionData]:
-        """Get the resolved part types dimensions."""
-        return self._part_types_dimensions.copy()
+    def part_types_dimensions(self) -> Mapping[str, BasicDimensionData]:
+        """
+        Get a read-only view of the resolved part types dimensions. Lookups are still
+        normalized. Use .copy() on the view if a mutable NormalizedDict is needed.
+        """
+        return MappingProxyType(self._part_types_dimensions)
 
     def get_part_types_dimensions(
         self,
@@ -221,27 +255,35 @@ class DimensionData(BasicDimensionData):
             | tuple[tuple[int | float, int | float, int | float], dict[str, Any]]
         ),
     ) -> tuple[tuple[int | float, int | float, int | float], dict[str, Any]]:
-        match dimensions:
-            case (x, y, z):
-                extras = {}
-            case ((x, y, z), {**extras}):
-                pass
-            case _:
-                raise TypeError(
-                    "get_part_types_dimensions must return either a tuple of three "
-                    "numbers (x_len, y_len, z_len) or a tuple containing a tuple of three "
-                    "numbers and a dictionary of extra dimensions. "
-                )
-        return (x, y, z), extras
+        # Explicit length dispatch for the two accepted shapes. Cheaper than a match
+        # statement, and the extras mapping is passed on as is instead of being copied.
+        # str, bytes and bytearray are not dimension sequences (as in a match sequence pattern).
+        if isinstance(dimensions, Sequence) and not isinstance(dimensions, (str, bytes, bytearray)):
+            if len(dimensions) == 3:
+                return tuple(dimensions), {}
+            if len(dimensions) == 2:
+                basic_dims, extras = dimensions
+                if (
+                    isinstance(basic_dims, Sequence)
+                    and not isinstance(basic_dims, (str, bytes, bytearray))
+                    and len(basic_dims) == 3
+                    and isinstance(extras, Mapping)
+                ):
+                    return tuple(basic_dims), extras
+        raise TypeError(
+            "get_part_types_dimensions must return either a tuple of three "
+            "numbers (x_len, y_len, z_len) or a tuple containing a tuple of three "
+            "numbers and a dictionary of extra dimensions. "
+        )
 
     def __getitem__(self, part_type) -> BasicDimensionData:
-        try:
-            return self._part_types_dimensions[part_type]
-        except KeyError as exc:
+        part_type_dimensions = self._part_types_dimensions.get(part_type)
+        if part_type_dimensions is None:
             raise KeyError(
                 f"Part type '{part_type}' not found. Implement get_part_types_dimensions "
                 f"on {self.__class__.__name__} to provide dimensions for specific part types."
-            ) from exc
+            )
+        return part_type_dimensions
 
 
 class BuilderABC(InheritanceMixin, ABC):
@@ -259,34 +301,53 @@ class BuilderABC(InheritanceMixin, ABC):
 
     # Resolved attributes. Dynamically assigned in __init_subclass__
     _resolved_part_types: frozenset[str]
+    _ordered_part_types: tuple[str, ...]
     _builder_map: NormalizedDict[str, Callable]
 
     @property
     def part_types(self) -> frozenset[str]:
+        """Registered (normalized) part types. Use for membership tests and set operations."""
         return self._resolved_part_types
 
+    @property
+    def ordered_part_types(self) -> tuple[str, ...]:
+        """Registered (normalized) part types in registration order (parents first)."""
+        return self._ordered_part_types
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        # Make a copy of concrete parents _builder_map (if concrete parent exists)
-        parent_builder_map = cls.get_parent_items("_builder_map") or NormalizedDict()
+        # Parents' merged _builder_map (if a concrete parent exists). Every class stores its
+        # fully merged map, hence resolved=True. With a single parent this is the parent's map
+        # object itself, so it is reused as is and must not be mutated.
+        parent_builder_map = cls.get_parent_items("_builder_map", resolved=True) or NormalizedDict()
 
         # Build the child_builder_map by scanning the class for methods with registered parts
         child_builder_map = NormalizedDict()
+        # One attribute probe per class attribute; callable() only for registered ones.
         for attr in cls.__dict__.values():
-            if callable(attr) and hasattr(attr, "_registered_part_type"):
-                part_type = attr._registered_part_type
+            part_type = getattr(attr, "_registered_part_type", None)
+            if part_type is not None and callable(attr):
                 child_builder_map[part_type] = attr
 
         # Current class_builder_map is the combined map, child definitions win if collisions.
-        cls._builder_map = parent_builder_map | child_builder_map
+        # A subclass that registers nothing new shares its parent's map instead of copying it
+        # (builder maps are never mutated after class creation).
+        if child_builder_map:
+            cls._builder_map = parent_builder_map | child_builder_map
+        else:
+            cls._builder_map = parent_builder_map
 
-        # Resolve part_types from the builder map
-        cls._resolved_part_types = frozenset(cls._builder_map.keys())
+        # Resolve part_types from the builder map: a tuple keeps registration order for
+        # iteration, a frozenset serves membership tests. Keys are interned strings with
+        # cached hashes, so building both costs no rehashing.
+        cls._ordered_part_types = tuple(cls._builder_map)
+        cls._resolved_part_types = frozenset(cls._ordered_part_types)
 
     def __init__(self, dim: DimensionData):
         self._dim = dim
-        self._solid_cache = NormalizedDict()
+        # Keyed by normalized part type (see build_part), so a plain dict is enough.
+        self._solid_cache: dict[str, cq.Solid] = {}
 
     @property
     def dim(self) -> DimensionData:
@@ -304,19 +365,25 @@ class BuilderABC(InheritanceMixin, ABC):
         Returns:
             cadquery.Workplane or cadquery.Solid.
         """
-        try:
-            build_func = self._builder_map[part_type]
-        except KeyError as exc:
+        # Normalize once; every dict access below is then an already-normalized fast lookup.
+        key = NormalizedDict.normalize_item(part_type)
+        if cached_solid:
+            # Only registered part types are ever cached, so a hit needs no builder lookup.
+            solid = self._solid_cache.get(key)
+            if solid is None:
+                solid = self._solid_cache[key] = self._get_build_func(key, part_type)(self).val()
+            return solid
+
+        return self._get_build_func(key, part_type)(self)
+
+    def _get_build_func(self, key: str, part_type: str) -> Callable:
+        """Return the build method for normalized key. part_type is used in the error message."""
+        build_func = self._builder_map.get(key)
+        if build_func is None:
             raise ValueError(
                 f"Invalid part type: {part_type}!\nAvailable: {list(self._builder_map.keys())}"
-            ) from exc
-
-        if cached_solid:
-            if part_type not in self._solid_cache:
-                self._solid_cache[part_type] = build_func(self).val()
-            return self._solid_cache[part_type]
-
-        return build_func(self)
+            )
+        return build_func
 
     def clear_cache(self) -> None:
         """Clear the solid cache."""
@@ -333,8 +400,9 @@ class BuilderABC(InheritanceMixin, ABC):
         """Decorator to register build methods."""
 
         def decorator(func):
-            # Defer attaching into _builder_map until __init_subclass__
-            func._registered_part_type = part_type
+            # Defer attaching into _builder_map until __init_subclass__. Normalized (and so
+            # interned) right away, non-string part types fail at decoration time.
+            func._registered_part_type = NormalizedDict.normalize_item(part_type, raise_error=True)
             return func
 
         return decorator
@@ -367,20 +435,33 @@ class AssemblerABC(InheritanceMixin, ABC):
 
     # Resolved attributes. Dynamically assigned in __init_subclass__
     _resolved_part_map: dict[str, str]
+    _identity_part_map: bool
+    _default_names: dict[str, str] | None
     _BuilderClass: type[BuilderABC]
+    _metadata_map_chain: tuple[Callable, ...]
 
     @property
-    def resolved_part_map(self) -> dict[str, str]:
-        return self._resolved_part_map.copy()
+    def resolved_part_map(self) -> Mapping[str, str]:
+        """
+        Get a read-only view of the resolved part -> part type map. Lookups are still
+        normalized. Use .copy() on the view if a mutable NormalizedDict is needed.
+        """
+        return MappingProxyType(self._resolved_part_map)
 
     @staticmethod
     def assy_name(part: str) -> str:
-        "Returns the default name for the specified part in the assembly."
+        """
+        Returns the default name for the specified part in the assembly.
+        Static and class method overrides are evaluated once per class, overrides written
+        as regular methods once per assemble call.
+        """
         return part.title().replace(" ", "_")
 
     @staticmethod
-    def normalize_values(mapping: dict[Any, str]) -> dict[Any, str]:
-        return {k: NormalizedDict.normalize_item(v) for k, v in mapping.items()}
+    def normalize_values(mapping: dict[str, str]) -> NormalizedDict[str, str]:
+        """Return mapping as a NormalizedDict with keys and values normalized in one pass."""
+        normalize = NormalizedDict.normalize_item
+        return NormalizedDict((key, normalize(value)) for key, value in mapping.items())
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -394,11 +475,21 @@ class AssemblerABC(InheritanceMixin, ABC):
         part_map = cls.__dict__.get("part_map", {})
         if not isinstance(part_map, dict):
             raise TypeError(f"{cls.__name__} part_map must be a dict.")
-        # NormalizedDict takes care of key normalization.
-        part_map = NormalizedDict(cls.normalize_values(part_map))
+        part_map = cls.normalize_values(part_map)
 
         cls._resolved_part_map = cls._resolve_part_map(part_map)
         cls._validate_resolved_part_map()
+        # Every part maps to itself (e.g. the part_map shortcut): assembly can skip the lookup.
+        cls._identity_part_map = all(k == v for k, v in cls._resolved_part_map.items())
+        # Default assembly names only depend on the (normalized) part, compute them once.
+        # An assy_name overridden as a regular method needs an instance, see _get_default_names.
+        if isinstance(cls._get_class_attribute("assy_name"), (staticmethod, classmethod)):
+            cls._default_names = {part: cls.assy_name(part) for part in cls._resolved_part_map}
+        else:
+            cls._default_names = None
+
+        # The MRO is fixed once the class exists, so resolve the get_metadata_map chain now.
+        cls._metadata_map_chain = cls._resolve_metadata_map_chain()
 
         # Delete class attributes only used for subclass setup
         for attr in cls._setup_attributes:
@@ -420,21 +511,31 @@ class AssemblerABC(InheritanceMixin, ABC):
            BuilderClass._resolved_part_types NOT in the _resolved_part_map (values)
            will be added with identity mapping (part_type: part_type).
         """
-        parent_part_map = cls.get_parent_items("_resolved_part_map") or NormalizedDict()
+        # Every class stores its fully merged part map, hence resolved=True.
+        parent_part_map = (
+            cls.get_parent_items("_resolved_part_map", resolved=True) or NormalizedDict()
+        )
         if part_map:
             return parent_part_map | part_map
 
         mapped_part_types = set(parent_part_map.values())
-        part_types = cls._BuilderClass._resolved_part_types
-        new_mappings = NormalizedDict({pt: pt for pt in part_types if pt not in mapped_part_types})
-        return new_mappings | parent_part_map
+        # Ordered, so identity mapped parts follow registration order.
+        part_types = cls._BuilderClass._ordered_part_types
+        resolved_part_map = NormalizedDict(
+            {pt: pt for pt in part_types if pt not in mapped_part_types}
+        )
+        # Both sides are NormalizedDicts: merge in place (one C-level update, no extra copy).
+        resolved_part_map.update(parent_part_map)
+        return resolved_part_map
 
     @classmethod
     def _validate_resolved_part_map(cls):
-        # Validate values of cls.part_map
-        actual_values = frozenset(cls._resolved_part_map.values())
+        # Validate values of cls.part_map in a single pass, no intermediate sets.
+        # dict.fromkeys dedupes (several parts may share a part type) in map order.
         allowed_values = cls._BuilderClass._resolved_part_types
-        invalid_values = actual_values - allowed_values
+        invalid_values = dict.fromkeys(
+            v for v in cls._resolved_part_map.values() if v not in allowed_values
+        )
         if invalid_values:
             invalid_values_str = "\n".join(invalid_values)
             raise ValueError(
@@ -443,6 +544,29 @@ class AssemblerABC(InheritanceMixin, ABC):
                 f"{invalid_values_str}"
             )
 
+    @classmethod
+    def _get_class_attribute(cls, attr_name: str) -> Any:
+        """Return the raw (unbound) class attribute attr_name from the first class in the MRO."""
+        for base in cls.__mro__:
+            if attr_name in base.__dict__:
+                return base.__dict__[attr_name]
+        return None
+
+    @classmethod
+    def _resolve_metadata_map_chain(cls) -> tuple[Callable, ...]:
+        """
+        Return the concrete get_metadata_map implementations defined along the MRO,
+        oldest first. Each implementation appears once, even if inherited by several
+        classes in the MRO, and abstract declarations are skipped.
+        """
+        chain = []
+        for base in reversed(cls.__mro__):
+            func = base.__dict__.get("get_metadata_map")
+            if func is None or getattr(func, "__isabstractmethod__", False):
+                continue
+            chain.append(func)
+        return tuple(chain)
+
     def __init__(
         self,
         dim: DimensionData,
@@ -477,6 +601,10 @@ class AssemblerABC(InheritanceMixin, ABC):
             if builder.dim is not dim:
                 raise ValueError("builder.dim must be the same DimensionData instance as `dim`.")
             self.builder = builder
+        # Results of get_metadata_map methods decorated with @AssemblerABC.pure_metadata
+        self._pure_metadata_cache: dict[Callable, dict] = {}
+        # Resolved (MRO merged) metadata map. Built on first assemble, see invalidate_metadata_cache
+        self._resolved_metadata_map_cache: NormalizedDict[str, dict[str, Any]] | None = None
 
     @property
     def dim(self) -> DimensionData:
@@ -487,6 +615,8 @@ class AssemblerABC(InheritanceMixin, ABC):
     def get_metadata_map(self) -> dict[str, dict]:
         """
         Subclasses must implement this to return a mapping of part names to metadata.
+        The merged result is cached per instance on first assemble. Call
+        invalidate_metadata_cache if assembler state it depends on changes afterwards.
         Metadata should include loc, name, color. Note that the keys in below example
         are StrAutoEnum members, but can be any string as long as they correspond
         to part names in the part_map. Example dict that should be returned:
@@ -505,50 +635,117 @@ class AssemblerABC(InheritanceMixin, ABC):
         }
         """
 
-    def _get_resolved_metadata_map(self) -> NormalizedDict[str, dict[str, Any]]:
-        resolved_map = NormalizedDict(self.get_metadata_map())
+    @staticmethod
+    def pure_metadata(func: Callable) -> Callable:
+        """
+        Opt-in decorator for get_metadata_map implementations that are pure functions
+        of the assembler's (frozen) dimensions. The decorated method is called once per
+        assembler instance; later assemble calls reuse the cached result.
+        Do not use it if the returned metadata depends on state that changes after __init__.
+        """
+        func._pure_metadata = True
+        return func
+
+    def _call_metadata_func(self, func: Callable) -> dict[str, dict]:
+        """Call a get_metadata_map implementation, using the cache if it is marked pure."""
+        # Bind through the descriptor protocol, so static and class methods work as well.
+        bound_func = func.__get__(self, type(self))
+        if not getattr(bound_func, "_pure_metadata", False):
+            return bound_func()
+        try:
+            return self._pure_metadata_cache[func]
+        except KeyError:
+            metadata_map = self._pure_metadata_cache[func] = bound_func()
+            return metadata_map
 
-        # Loop through ancester updating resolved_map
-        for base in self.__class__.__mro__[1:]:
-            parent_func = getattr(base, "get_metadata_map", None)
-            if parent_func is None or hasattr(parent_func, "__isabstractmethod__"):
-                continue
+    def invalidate_metadata_cache(self) -> None:
+        """
+        Discard the cached resolved metadata map so that the next assemble call rebuilds it.
+        Call this after changing assembler state that get_metadata_map depends on.
+        Cached results of @AssemblerABC.pure_metadata methods are kept since they only
+        depend on the (frozen) dimensions.
+        """
+        self._resolved_metadata_map_cache = None
 
-            parent_map = NormalizedDict(parent_func(self))
-            # Younger parents come first in mro and should override older parents
-            resolved_map = parent_map | resolved_map
+    def clear_cache(self) -> None:
+        """
+        Clear the builder's solid cache and the cached resolved metadata map.
+        Pure metadata results are kept, see invalidate_metadata_cache.
+        """
+        self.builder.clear_cache()
+        self.invalidate_metadata_cache()
 
+    def _get_resolved_metadata_map(self) -> NormalizedDict[str, dict[str, Any]]:
+        """
+        Return the metadata map merged across the MRO. Computed once per instance and
+        cached, see invalidate_metadata_cache.
+        """
+        if self._resolved_metadata_map_cache is None:
+            self._resolved_metadata_map_cache = self._compute_resolved_metadata_map()
+        return self._resolved_metadata_map_cache
+
+    def _compute_resolved_metadata_map(self) -> NormalizedDict[str, dict[str, Any]]:
+        resolved_map = NormalizedDict()
+        # Chain is ordered oldest first, so younger classes override older ones on collision.
+        for func in self._metadata_map_chain:
+            resolved_map.update(self._call_metadata_func(func))
         return resolved_map
 
-    def _get_assembly_data(self, parts: Iterable[str]) -> list[tuple[cq.Workplane, dict]]:
-        """Helper used by 'assemble' to build parts and attach metadata."""
-        data = []
+    def _get_default_names(self) -> dict[str, str]:
+        """Return the default assembly name per part, precomputed per class when possible."""
+        if self._default_names is not None:
+            return self._default_names
+        return {part: self.assy_name(part) for part in self._resolved_part_map}
+
+    def _get_assembly_data(self, parts: Iterable[str]) -> Iterator[tuple[cq.Solid, dict]]:
+        """
+        Helper used by 'assemble' to build parts and attach metadata.
+        Yields (solid, metadata) per part, so parts are built as the assembly consumes them.
+        """
+        # Bind everything used per part up front; the loop runs once per assembly part.
         resolved_metadata_map = self._get_resolved_metadata_map()
+        part_map = None if self._identity_part_map else self._resolved_part_map
+        build_part = self.builder.build_part
+        default_names = self._get_default_names()
+        color = self.color
+        # Several parts may share one part type (e.g. mirrored panels). Build each once.
+        solids: dict[str, cq.Solid] = {}
 
         for part in parts:
-            metadata: dict = resolved_metadata_map.get(part, {})
-            metadata.setdefault("name", self.assy_name(part))
-            metadata.setdefault("color", self.color)
-            part_type = self._resolved_part_map[part]
-            solid = self.builder.build_part(part_type, cached_solid=True)
-            data.append((solid, metadata))
-        return data
+            # A fresh dict, so defaults are never written into (possibly cached) metadata maps.
+            # Metadata from get_metadata_map comes last and overrides the defaults.
+            metadata = {
+                "name": default_names[part],
+                "color": color,
+                **resolved_metadata_map.get(part, {}),
+            }
+            part_type = part if part_map is None else part_map[part]
+            solid = solids.get(part_type)
+            if solid is None:
+                solid = solids[part_type] = build_part(part_type, cached_solid=True)
+            yield solid, metadata
 
     def assemble(self, parts: Iterable[str] | None = None) -> cq.Assembly:
         """
         Build an assembly from specified parts.
 
         Args:
-            parts: Iterable of parts used in assembly. Defaults to all parts.
+            parts: Iterable of parts used in assembly. Defaults to all parts
+                (None or an empty iterable).
 
         Returns:
             cadquery.Assembly
         """
-        assembly_parts = set(parts) if parts else self._resolved_part_map.keys()
+        # Normalize while deduplicating, so differently spelled parts are added only once.
+        # dict.fromkeys keeps the given order, so the assembly is built deterministically.
+        assembly_parts = dict.fromkeys(map(NormalizedDict.normalize_item, parts or ()))
+        if not assembly_parts:
+            assembly_parts = self._resolved_part_map.keys()
         assembly = cq.Assembly()
+        add = assembly.add
 
         for solid, metadata in self._get_assembly_data(assembly_parts):
-            assembly.add(solid, **metadata)
+            add(solid, **metadata)
         return assembly
 
     @classmethod
@@ -59,7 +59,7 @@ def export_part_types(
     out_path.mkdir(parents=True, exist_ok=True)
 
     if part_types is None:
-        target_part_types: list[str] = list(builder.part_types)
+        target_part_types: list[str] = list(builder.ordered_part_types)
     else:
         target_part_types = list(part_types)
         _validate_membership(target_part_types, builder.part_types, label="PartType")
@@ -90,8 +90,9 @@ def export_assembly(
             must match ``file_format`` (case-insensitive), otherwise a
             ``ValueError`` is raised.
         parts: Iterable of Parts to include in the assembly. ``None``
-            (default) builds the assembler's full part_map. Each entry
-            must be in ``assembler.resolved_part_map``; otherwise a
+            (default) or an empty iterable builds the assembler's full
+            part_map. Each entry must be in
+            ``assembler.resolved_part_map``; otherwise a
             ``ValueError`` is raised listing valid Parts.
         file_format: Output format. Phase 1 supports only ``".step"``.
 
@@ -1,4 +1,5 @@
-from collections import UserDict
+import sys
+from collections.abc import ItemsView, Iterable, KeysView, Mapping
 from enum import StrEnum
 from typing import Any, Generic, TypeVar
 
@@ -18,28 +19,72 @@ class StrAutoEnum(StrEnum):
 K = TypeVar("K")
 V = TypeVar("V")
 
+# Sentinel for lookups where None is a valid value.
+_MISSING = object()
 
-class NormalizedDict(UserDict, Generic[K, V]):
+
+# Memo of normalized keys (raw key -> normalized key). A plain dict rather than lru_cache:
+# it is probed directly from normalize_item, and StrEnum members (str subclasses) hit it
+# without lru_cache building a tuple key on every call. Bounded like the cache it replaced.
+_normalized_keys: dict[str, str] = {}
+_MAX_NORMALIZED_KEYS = 1024
+
+
+def _normalize_str(key: str) -> str:
+    """
+    Memoized key normalization. Part and part type keys are a small, fixed set of strings
+    looked up over and over, so the memo spares repeated strip()/lower() allocations.
+    Results are interned so that every normalized key (builder maps, part maps, caches and
+    the lookup keys used against them) is the same object and dict probes hit on identity.
+    """
+    # strip() returns an exact str. For an exact str with nothing to strip it is the string
+    # itself, so such already normalized keys allocate no new string. str subclasses (e.g.
+    # StrAutoEnum members) always get a fresh copy, which the memo then spares on later calls.
+    stripped = key.strip()
+    normalized = sys.intern(stripped if stripped.islower() else stripped.lower())
+    if len(_normalized_keys) < _MAX_NORMALIZED_KEYS:
+        _normalized_keys[key] = normalized
+    return normalized
+
+
+class NormalizedDict(dict, Generic[K, V]):
     """
     Used for all dicts where part types are used as keys.
     Normalizes keys to lowercase stripped strings (both for setting/getting items).
+
+    Subclasses dict directly. Stored keys are always normalized, so item access first
+    tries the key as given with the C-level dict lookup; only on a miss does __missing__
+    normalize the key and retry. Keys that are already normalized (StrAutoEnum members
+    and all internal traffic) therefore never reach Python-level code on lookup.
+    All other mutating/reading dict methods are overridden to normalize their keys,
+    keys() and items() return views whose membership tests normalize as well.
     """
 
+    # No per-instance __dict__: a NormalizedDict is only its dict storage.
+    __slots__ = ()
+
+    def __init__(self, other: Mapping[K, V] | Iterable[tuple[K, V]] | None = None, /, **kwargs: V):
+        super().__init__()
+        self.update(other, **kwargs)
+
     @staticmethod
     def normalize_item(key: K, raise_error: bool = False) -> str | Any:
         """
         Normalize keys to lowercase strings. If raise_error is False will return
         the original key without raising if original key is not a string.
         """
-        try:
-            return key.strip().lower()
-        except AttributeError as exc:
-            if raise_error:
-                raise TypeError(f"Keys must be strings, got {type(key).__name__}: {key!r}") from exc
-            return key
-
-    def __getitem__(self, key: K) -> V:
-        return super().__getitem__(self.normalize_item(key))
+        if isinstance(key, str):
+            return _normalized_keys.get(key) or _normalize_str(key)
+        if raise_error:
+            raise TypeError(f"Keys must be strings, got {type(key).__name__}: {key!r}")
+        return key
+
+    def __missing__(self, key: K) -> V:
+        # Called by dict.__getitem__ when the key as given is not stored.
+        normalized = self.normalize_item(key)
+        if normalized != key and super().__contains__(normalized):
+            return super().__getitem__(normalized)
+        raise KeyError(key)
 
     def __setitem__(self, key: K, value: V) -> None:
         super().__setitem__(self.normalize_item(key, raise_error=True), value)
@@ -48,7 +93,90 @@ class NormalizedDict(UserDict, Generic[K, V]):
         super().__delitem__(self.normalize_item(key))
 
     def __contains__(self, key: K) -> bool:
-        return super().__contains__(self.normalize_item(key))
+        return super().__contains__(key) or super().__contains__(self.normalize_item(key))
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        # Key as given first (C-level), normalized only on a miss. No exception on a miss.
+        value = super().get(key, _MISSING)
+        if value is _MISSING:
+            value = super().get(self.normalize_item(key), default)
+        return value
+
+    def keys(self) -> KeysView[K]:
+        # Membership goes through __contains__ (normalized), iteration and len stay C-level.
+        return KeysView(self)
+
+    def items(self) -> ItemsView[K, V]:
+        # Membership goes through __getitem__, so the key of an item is normalized too.
+        return ItemsView(self)
+
+    def pop(self, key: K, *default: Any) -> V | Any:
+        return super().pop(self.normalize_item(key), *default)
+
+    def popitem(self) -> tuple[K, V]:
+        # First inserted item first, as MutableMapping.popitem does (dict.popitem is LIFO).
+        try:
+            key = next(iter(self))
+        except StopIteration:
+            raise KeyError("popitem(): dictionary is empty") from None
+        return key, super().pop(key)
+
+    def setdefault(self, key: K, default: V | None = None) -> V:
+        return super().setdefault(self.normalize_item(key, raise_error=True), default)
+
+    def update(
+        self, other: Mapping[K, V] | Iterable[tuple[K, V]] | None = None, /, **kwargs: V
+    ) -> None:
+        # Plain dicts (the common case) are detected with a C-level type check first;
+        # only other inputs pay for the Mapping ABC check.
+        if other is None:
+            other = ()
+        elif isinstance(other, dict):
+            if isinstance(other, NormalizedDict):
+                # Keys of another NormalizedDict are already normalized: one C-level merge.
+                dict.update(self, other)
+                other = ()
+            else:
+                other = other.items()
+        elif isinstance(other, Mapping):
+            other = other.items()
+        elif hasattr(other, "keys"):
+            other = ((key, other[key]) for key in other.keys())
+        for key, value in other:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def copy(self) -> "NormalizedDict[K, V]":
+        new = type(self)()
+        # Keys are already normalized, plain dict update is enough.
+        dict.update(new, self)
+        return new
+
+    @classmethod
+    def fromkeys(cls, iterable: Iterable[K], value: V | None = None) -> "NormalizedDict[K, V]":
+        new = cls()
+        for key in iterable:
+            new[key] = value
+        return new
+
+    def __or__(self, other: Mapping[K, V]) -> "NormalizedDict[K, V]":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other: Mapping[K, V]) -> "NormalizedDict[K, V]":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        new = type(self)(other)
+        new.update(self)
+        return new
+
+    def __ior__(self, other: Mapping[K, V]) -> "NormalizedDict[K, V]":
+        self.update(other)
+        return self
 
 
 class InheritanceMixin:
@@ -58,25 +186,47 @@ class InheritanceMixin:
     def get_parent_items(
         cls,
         attr_name: str,
+        resolved: bool = False,
     ) -> set[str] | dict[str, str] | None:
         """
         Return the union of the inherited attribute across the class MRO.
         If collisions are found, the younger (more derived) class's items take precedence.
         If the attribute is not found in any ancestor, returns None.
+        With a single contributing ancestor its own items are returned, so do not mutate
+        the result.
+
+        Pass resolved=True only if every class stores the attribute already merged with its
+        own ancestors (e.g. _builder_map). Bases covered by an already merged subclass are
+        then skipped, so a single inheritance chain returns the parent's items as is.
         """
-        # Loop through ancestors creating parent_items
-        parent_items = None
+        # Loop through ancestors collecting the items to merge, youngest first
+        found_items = []
+        merged_bases: list[type] = []
         for base in cls.__mro__[1:]:
+            if resolved and any(issubclass(merged, base) for merged in merged_bases):
+                continue
             current_items = getattr(base, attr_name, None)
             if current_items is None:
                 continue
-
-            if parent_items is None:
-                parent_items = current_items
-            else:
-                # parent_items already holds younger entries; merging older
-                # current_items in this direction lets younger win on collision.
-                parent_items = current_items | parent_items
+            merged_bases.append(base)
+            found_items.append(current_items)
+
+        if not found_items:
+            parent_items = None
+        elif len(found_items) == 1:
+            parent_items = found_items[0]
+        elif hasattr(found_items[-1], "update"):
+            # Single accumulator: copy the oldest items once, then update with
+            # younger items so they win on collision.
+            parent_items = found_items[-1].copy()
+            for current_items in reversed(found_items[:-1]):
+                parent_items.update(current_items)
+        else:
+            # Immutable items (e.g. frozenset) cannot be updated in place: merge with |,
+            # younger items on the right so they win on collision.
+            parent_items = found_items[-1]
+            for current_items in reversed(found_items[:-1]):
+                parent_items = parent_items | current_items
 
         return parent_items
 
@@ -90,10 +240,12 @@ class _PostInitMeta(type):
 
     def __call__(cls, *args, **kwargs):
         instance = super().__call__(*args, **kwargs)
-        if not hasattr(instance, "_post_init"):
+        # One attribute lookup instead of hasattr() followed by the call's own lookup.
+        post_init = getattr(instance, "_post_init", None)
+        if post_init is None:
             raise TypeError(
                 f"Since class '{cls.__name__}' has metaclass=_PostInitMeta "
                 "it must implement a '_post_init' method."
             )
-        instance._post_init(*args, **kwargs)
+        post_init(*args, **kwargs)
         return instance
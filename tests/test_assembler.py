@@ -1,8 +1,17 @@
 import unittest
 
+import cadquery as cq
 from cadquery import Assembly
 
-from tests.test_project.assembly import PartialAssemblerOuterLeaf
+from py_cad import AssemblerABC
+from py_cad.helpers import NormalizedDict
+from tests.test_project.assembly import (
+    PartialAssemblerBase,
+    PartialAssemblerLeaf,
+    PartialAssemblerMidOne,
+    PartialAssemblerMidTwo,
+    PartialAssemblerOuterLeaf,
+)
 from tests.test_project.parts import PartialBuilderOuterLeaf
 from tests.test_project.project_data import (
     BOX_X,
@@ -33,6 +42,32 @@ class TestAssemblerABC(unittest.TestCase):
         all_part_types = frozenset(member.value for member in PartType)
         self.assertEqual(mapped_part_types, all_part_types)
 
+    def test_normalize_values(self):
+        normalized = AssemblerABC.normalize_values({" Part ": " Part_Type "})
+        self.assertIsInstance(normalized, NormalizedDict)
+        self.assertEqual(normalized, {"part": "part_type"})
+
+    def test_diamond_part_map_merge(self):
+        # Both diamond branches contribute; merging must not write into a parent's map.
+        leaf_parts = PartialAssemblerLeaf._resolved_part_map
+        for part in (Part.BOTTOM, Part.LONG_SIDE, Part.LONG_SIDE_INVERSE, Part.SHORT_SIDE):
+            self.assertIn(part, leaf_parts)
+        self.assertNotIn(Part.LONG_SIDE_INVERSE, PartialAssemblerMidOne._resolved_part_map)
+        self.assertNotIn(Part.LONG_SIDE, PartialAssemblerMidTwo._resolved_part_map)
+
+    def test_clear_cache(self):
+        self.assembler.assemble()
+        self.assembler.clear_cache()
+        self.assertIsNone(self.assembler._resolved_metadata_map_cache)
+        self.assertEqual(self.assembler.builder._solid_cache, {})
+
+    def test_resolved_part_map_read_only_view(self):
+        view = self.assembler.resolved_part_map
+        self.assertEqual(view[" LONG_SIDE "], PartType.LONG_SIDE_PANEL)
+        self.assertIn(" LONG_SIDE ", view.keys())
+        with self.assertRaises(TypeError):
+            view[Part.TOP] = PartType.BOTTOM
+
     def test_get_resolved_metadata_map(self):
         # Test if resolved metadata map contains all parts
         metadata_map = self.assembler._get_resolved_metadata_map()
@@ -41,6 +76,51 @@ class TestAssemblerABC(unittest.TestCase):
             self.assertIn(part, metadata_map)
             self.assertIsInstance(metadata_map[part], dict)
 
+    def test_metadata_map_chain_order(self):
+        # Oldest first, one entry per class defining get_metadata_map, diamond in MRO order.
+        expected = tuple(
+            cls.__dict__["get_metadata_map"]
+            for cls in (
+                PartialAssemblerBase,
+                PartialAssemblerMidTwo,
+                PartialAssemblerMidOne,
+                PartialAssemblerLeaf,
+                PartialAssemblerOuterLeaf,
+            )
+        )
+        self.assertEqual(PartialAssemblerOuterLeaf._metadata_map_chain, expected)
+
+    def test_static_and_class_method_metadata_maps(self):
+        class StaticAssembler(PartialAssemblerOuterLeaf):
+            BuilderClass = PartialBuilderOuterLeaf
+
+            @staticmethod
+            def get_metadata_map():
+                return {Part.TOP: {"name": "Static Top"}}
+
+        class ClassAssembler(StaticAssembler):
+            BuilderClass = PartialBuilderOuterLeaf
+
+            @classmethod
+            def get_metadata_map(cls):
+                return {Part.BOTTOM: {"name": cls.__name__}}
+
+        assembly = ClassAssembler(DIMENSION_DATA).assemble()
+        self.assertEqual(len(assembly.children), len(Part))
+        names = {child.name for child in assembly.children}
+        self.assertTrue({"Static Top", "ClassAssembler"} <= names)
+
+    def test_resolved_metadata_map_cached(self):
+        first = self.assembler._get_resolved_metadata_map()
+        self.assertIs(self.assembler._get_resolved_metadata_map(), first)
+
+    def test_invalidate_metadata_cache(self):
+        first = self.assembler._get_resolved_metadata_map()
+        self.assembler.invalidate_metadata_cache()
+        second = self.assembler._get_resolved_metadata_map()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.keys(), first.keys())
+
     def test_assemble_all_parts(self):
         # Test assembling all parts
         assembly = self.assembler.assemble()
@@ -54,6 +134,25 @@ class TestAssemblerABC(unittest.TestCase):
         self.assertIsInstance(assembly, Assembly)
         self.assertEqual(len(assembly.children), len(selected_parts))
 
+    def test_assemble_empty_parts(self):
+        # An empty iterable means all parts, like None.
+        assembly = self.assembler.assemble(parts=[])
+        self.assertEqual(len(assembly.children), len(Part))
+
+    def test_assemble_keeps_part_order(self):
+        selected_parts = [Part.TOP, Part.SHORT_SIDE, Part.BOTTOM, Part.TOP]
+        assembly = self.assembler.assemble(parts=selected_parts)
+        names = [child.name for child in assembly.children]
+        expected = [
+            self.assembler._get_resolved_metadata_map()[part]["name"]
+            for part in (Part.TOP, Part.SHORT_SIDE, Part.BOTTOM)
+        ]
+        self.assertEqual(names, expected)
+
+    def test_assemble_deduplicates_normalized_parts(self):
+        assembly = self.assembler.assemble(parts=[Part.BOTTOM, " Bottom ", "BOTTOM"])
+        self.assertEqual(len(assembly.children), 1)
+
     def test_get_assembly(self):
         # Test getting the assembly directly
         assembly = self.assembler.get_assembly(DIMENSION_DATA)
@@ -103,5 +202,93 @@ class TestAssemblerBuilderKwarg(unittest.TestCase):
             PartialAssemblerOuterLeaf(DIMENSION_DATA, builder=builder_for_other)
 
 
+class TestIdentityPartMap(unittest.TestCase):
+    """Omitting part_map maps every part type to itself, assembly skips the lookup."""
+
+    def setUp(self):
+        class IdentityAssembler(AssemblerABC):
+            BuilderClass = PartialBuilderOuterLeaf
+
+            def get_metadata_map(self):
+                return {}
+
+        self.assembler = IdentityAssembler(DIMENSION_DATA)
+
+    def test_identity_part_map_flag(self):
+        self.assertTrue(self.assembler._identity_part_map)
+        self.assertFalse(PartialAssemblerOuterLeaf._identity_part_map)
+
+    def test_assemble_identity_part_map(self):
+        assembly = self.assembler.assemble()
+        self.assertEqual(len(assembly.children), len(PartType))
+
+    def test_assemble_identity_part_map_normalizes_parts(self):
+        assembly = self.assembler.assemble([" BOTTOM "])
+        self.assertEqual(len(assembly.children), 1)
+
+    def test_default_names(self):
+        expected = {part_type: AssemblerABC.assy_name(part_type) for part_type in PartType}
+        self.assertEqual(self.assembler._default_names, expected)
+        names = {child.name for child in self.assembler.assemble().children}
+        self.assertEqual(names, set(expected.values()))
+
+    def test_assemble_unknown_part_raises(self):
+        with self.assertRaises(KeyError):
+            self.assembler.assemble(["not_a_part"])
+
+    def test_assy_name_regular_method_override(self):
+        class NamedAssembler(type(self.assembler)):
+            BuilderClass = PartialBuilderOuterLeaf
+            prefix = "Box"
+
+            def assy_name(self, part):
+                return f"{self.prefix}_{part}"
+
+        self.assertIsNone(NamedAssembler._default_names)
+        names = {child.name for child in NamedAssembler(DIMENSION_DATA).assemble().children}
+        self.assertEqual(names, {f"Box_{part_type}" for part_type in PartType})
+
+
+class TestPureMetadata(unittest.TestCase):
+    """``@AssemblerABC.pure_metadata`` caches a get_metadata_map result per instance."""
+
+    def setUp(self):
+        self.calls = 0
+        test_case = self
+
+        class PureAssembler(PartialAssemblerOuterLeaf):
+            BuilderClass = PartialBuilderOuterLeaf
+
+            @AssemblerABC.pure_metadata
+            def get_metadata_map(self):
+                test_case.calls += 1
+                # No name/color, so assemble has to fill in the defaults.
+                return {Part.TOP: {"loc": cq.Location((0, 0, self.assy_dst_top))}}
+
+        self.assembler = PureAssembler(DIMENSION_DATA)
+
+    def test_pure_metadata_map_called_once(self):
+        self.assembler.assemble()
+        self.assembler.assemble()
+        self.assertEqual(self.calls, 1)
+
+    def test_pure_metadata_cache_is_per_instance(self):
+        self.assembler.assemble()
+        type(self.assembler)(DIMENSION_DATA).assemble()
+        self.assertEqual(self.calls, 2)
+
+    def test_pure_metadata_survives_invalidate(self):
+        self.assembler.assemble()
+        self.assembler.invalidate_metadata_cache()
+        self.assembler.assemble()
+        self.assertEqual(self.calls, 1)
+
+    def test_defaults_not_written_into_cached_map(self):
+        self.assembler.assemble()
+        (cached_map,) = self.assembler._pure_metadata_cache.values()
+        self.assertNotIn("name", cached_map[Part.TOP])
+        self.assertNotIn("color", cached_map[Part.TOP])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,47 @@ class TestBuilderABC(unittest.TestCase):
         excpected_part_types = frozenset(member.value for member in PartType)
         self.assertEqual(actual_part_types, excpected_part_types)
 
+    def test_part_types_in_registration_order(self):
+        expected = [
+            PartType.BOTTOM,
+            PartType.LONG_SIDE_PANEL,
+            PartType.SHORT_SIDE_PANEL,
+            PartType.TOP,
+        ]
+        self.assertEqual(list(self.builder.ordered_part_types), expected)
+
+    def test_part_types_is_hashable_frozenset(self):
+        self.assertIsInstance(self.builder.part_types, frozenset)
+        self.assertEqual(hash(self.builder.part_types), hash(frozenset(PartType)))
+        self.assertEqual(self.builder.part_types, frozenset(self.builder.ordered_part_types))
+
+    def test_subclass_without_registrations_shares_builder_map(self):
+        class PlainSubclass(PartialBuilderOuterLeaf):
+            pass
+
+        self.assertIs(PlainSubclass._builder_map, PartialBuilderOuterLeaf._builder_map)
+        self.assertEqual(PlainSubclass(DIMENSION_DATA).part_types, self.builder.part_types)
+
+    def test_combine_with_slotted_base(self):
+        class Slotted:
+            __slots__ = ("extra",)
+
+        class Combined(PartialBuilderOuterLeaf, Slotted):
+            pass
+
+        builder = Combined(DIMENSION_DATA)
+        builder.extra = 1
+        self.assertIs(builder.dim, DIMENSION_DATA)
+
+    def test_register_normalizes_part_type(self):
+        def build():
+            pass
+
+        func = PartialBuilderOuterLeaf.register(" Some_Part ")(build)
+        self.assertEqual(func._registered_part_type, "some_part")
+        with self.assertRaises(TypeError):
+            PartialBuilderOuterLeaf.register(1)(build)
+
     def test_build_part_valid(self):
         # Test valid part building
         for part_type in PartType:
@@ -26,6 +67,8 @@ class TestBuilderABC(unittest.TestCase):
         # Test invalid part type raises ValueError
         with self.assertRaises(ValueError):
             self.builder.build_part("invalid_part")
+        with self.assertRaises(ValueError):
+            self.builder.build_part("invalid_part", cached_solid=True)
 
     def test_cache_solid(self):
         # Test caching functionality
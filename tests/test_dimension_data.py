@@ -1,6 +1,7 @@
 import unittest
 
 from py_cad import BasicDimensionData, DimensionData
+from py_cad.helpers import _PostInitMeta
 
 
 class TestBasicDimensionData(unittest.TestCase):
@@ -19,6 +20,26 @@ class TestBasicDimensionData(unittest.TestCase):
         with self.assertRaises(AttributeError):
             data.x_len = 5
 
+    def test_instance_dict_holds_no_scratch_attributes(self):
+        data = BasicDimensionData((1, 2, 3), a=10)
+        self.assertNotIn("_freeze", vars(data))
+        self.assertNotIn("_repr_cache", vars(data))
+        unfrozen = BasicDimensionData(freeze=False)
+        self.assertEqual(vars(unfrozen), {})
+
+    def test_combine_with_slotted_base(self):
+        class Slotted:
+            __slots__ = ("extra",)
+
+        class Combined(DimensionData, Slotted):
+            pass
+
+        data = Combined((1, 2, 3))
+        data.extra = 1
+        self.assertEqual((data.x_len, data.extra), (1, 1))
+        with self.assertRaises(AttributeError):
+            data.x_len = 5
+
     def test_setting_frozen_inside_init(self):
         class MyDim(BasicDimensionData):
             def __init__(self):
@@ -41,12 +62,52 @@ class TestBasicDimensionData(unittest.TestCase):
         with self.assertRaises(AttributeError):
             data.new_attr = 456
 
+    def test_repr(self):
+        data = BasicDimensionData((1, 2, 3), b=5, a=4)
+        self.assertEqual(repr(data), "BasicDimensionData(a=4, b=5, x_len=1, y_len=2, z_len=3)")
+
+    def test_repr_updates_when_attribute_added_after_freeze(self):
+        data = BasicDimensionData((1, 2, 3))
+        self.assertNotIn("extra", repr(data))
+        data.extra = 7
+        self.assertIn("extra=7", repr(data))
+
     def test_freeze_without_basic_dimensions_raises(self):
         data = BasicDimensionData(freeze=False)
         with self.assertRaises(ValueError):
             data.freeze_existing_attributes()
 
 
+class TestPostInitMeta(unittest.TestCase):
+    def test_post_init_called_with_init_args(self):
+        class WithPostInit(metaclass=_PostInitMeta):
+            def __init__(self, value):
+                self.value = value
+
+            def _post_init(self, value):
+                self.post_value = value * 2
+
+        instance = WithPostInit(2)
+        self.assertEqual((instance.value, instance.post_value), (2, 4))
+
+    def test_missing_post_init_raises(self):
+        class WithoutPostInit(metaclass=_PostInitMeta):
+            pass
+
+        with self.assertRaises(TypeError):
+            WithoutPostInit()
+
+    def test_post_init_assigned_after_class_creation(self):
+        class LatePostInit(metaclass=_PostInitMeta):
+            pass
+
+        def _post_init(self):
+            self.post_called = True
+
+        LatePostInit._post_init = _post_init
+        self.assertTrue(LatePostInit().post_called)
+
+
 class TestDimensionData(unittest.TestCase):
     class MyDimData(DimensionData):
         def get_part_types_dimensions(self):
@@ -74,6 +135,17 @@ class TestDimensionData(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = dim["baz"]
 
+    def test_part_types_dimensions_read_only_view(self):
+        dim = self.MyDimData((1, 2, 3))
+        view = dim.part_types_dimensions
+        self.assertIs(view[" FOO "], dim["foo"])
+        self.assertIn("BAR", view)
+        with self.assertRaises(TypeError):
+            view["baz"] = BasicDimensionData((7, 8, 9))
+        mutable = view.copy()
+        mutable["baz"] = BasicDimensionData((7, 8, 9))
+        self.assertNotIn("baz", dim.part_types_dimensions)
+
     def test_part_types_dimensions_type_check(self):
         # Should raise if get_part_types_dimensions returns invalid mapping
         class BadDim(DimensionData):
@@ -83,6 +155,21 @@ class TestDimensionData(unittest.TestCase):
         with self.assertRaises(TypeError):
             BadDim((1, 2, 3), mat_thickness=1)
 
+    def test_normalize_part_type_dimensions_invalid_shapes(self):
+        for bad in (
+            123,
+            "abc",
+            b"abc",
+            bytearray(b"abc"),
+            (b"abc", {}),
+            (1, 2),
+            ((1, 2, 3), 5),
+            ((1, 2), {"foo": 1}),
+        ):
+            with self.subTest(dimensions=bad):
+                with self.assertRaises(TypeError):
+                    DimensionData._normalize_part_type_dimensions(bad)
+
     def test_subclass_without_get_part_types_dimensions(self):
         class NoOverrideDim(DimensionData):
             pass  # No get_part_types_dimensions
@@ -94,6 +181,14 @@ class TestDimensionData(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = dim["any_part"]
 
+    def test_get_part_types_dimensions_must_return_mapping(self):
+        class PairsDim(DimensionData):
+            def get_part_types_dimensions(self):
+                return [("some_part", (1, 2, 3))]
+
+        with self.assertRaises(TypeError):
+            PairsDim((1, 2, 3))
+
     def test_update_part_type_dim_formats(self):
         dim = BasicDimensionData(freeze=False)
         # Tuple format
@@ -90,6 +90,11 @@ class TestExportAssembly(unittest.TestCase):
         self.assertTrue(path.exists())
         self.assertTrue(_read_first_line(path).startswith(STEP_HEADER_PREFIX))
 
+    def test_empty_parts_writes_full_assembly(self):
+        path = export_assembly(self.assembler, self.tmp_dir / "empty.step", parts=[])
+        self.assertTrue(path.exists())
+        self.assertTrue(_read_first_line(path).startswith(STEP_HEADER_PREFIX))
+
     def test_unknown_part_raises(self):
         with self.assertRaises(ValueError) as ctx:
             export_assembly(
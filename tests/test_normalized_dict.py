@@ -1,6 +1,6 @@
 import unittest
 
-from py_cad.helpers import NormalizedDict
+from py_cad.helpers import InheritanceMixin, NormalizedDict, StrAutoEnum
 
 
 class TestNormalizedDict(unittest.TestCase):
@@ -31,11 +31,24 @@ class TestNormalizedDict(unittest.TestCase):
         self.assertIn(" b ", self.d)
         self.assertNotIn(" c ", self.d)
 
+    def test_view_membership(self):
+        self.assertIn(" A ", self.d.keys())
+        self.assertNotIn(" c ", self.d.keys())
+        self.assertIn((" A ", 1), self.d.items())
+        self.assertNotIn((" A ", 2), self.d.items())
+        self.assertNotIn((10, 1), self.d.items())
+        self.assertEqual(list(self.d.keys()), ["a", "b"])
+        self.assertEqual(list(self.d.items()), [("a", 1), ("b", 2)])
+        self.assertEqual(len(self.d.keys()), 2)
+
     def test_get_method(self):
         self.assertEqual(self.d.get(" A "), 1)
         self.assertEqual(self.d.get("b"), 2)
         self.assertIsNone(self.d.get("nonexistent"))
         self.assertEqual(self.d.get("nonexistent", 99), 99)
+        self.assertEqual(self.d.get(10, 99), 99)
+        self.d["none"] = None
+        self.assertIsNone(self.d.get(" NONE ", 99))
 
     def test_pop_method(self):
         val = self.d.pop(" A ")
@@ -50,6 +63,17 @@ class TestNormalizedDict(unittest.TestCase):
         val2 = self.d.setdefault(" d ", 99)
         self.assertEqual(val2, 4)
 
+    def test_popitem_first_inserted(self):
+        self.assertEqual(self.d.popitem(), ("a", 1))
+        self.assertEqual(self.d.popitem(), ("b", 2))
+        with self.assertRaises(KeyError):
+            self.d.popitem()
+
+    def test_none_input(self):
+        self.assertEqual(NormalizedDict(None), {})
+        self.d.update(None)
+        self.assertEqual(self.d, {"a": 1, "b": 2})
+
     def test_update_method(self):
         self.d.update({" E ": 5, " F ": 6})
         self.assertIn("e", self.d)
@@ -57,11 +81,87 @@ class TestNormalizedDict(unittest.TestCase):
         self.assertEqual(self.d[" e "], 5)
         self.assertEqual(self.d["f"], 6)
 
+    def test_init_with_kwargs(self):
+        d = NormalizedDict({" X ": 1}, Y=2)
+        self.assertEqual(d, {"x": 1, "y": 2})
+
+    def test_is_dict_subclass(self):
+        self.assertIsInstance(self.d, dict)
+        self.assertEqual(dict(self.d), {"a": 1, "b": 2})
+
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.d.extra = 1
+
+    def test_missing_key_error_uses_given_key(self):
+        with self.assertRaises(KeyError) as ctx:
+            _ = self.d[" Nope "]
+        self.assertEqual(ctx.exception.args, (" Nope ",))
+
+    def test_copy(self):
+        copy = self.d.copy()
+        self.assertIsInstance(copy, NormalizedDict)
+        self.assertEqual(copy, self.d)
+        copy["c"] = 3
+        self.assertNotIn("c", self.d)
+
+    def test_or_operators(self):
+        merged = self.d | {" B ": 20, "C": 3}
+        self.assertIsInstance(merged, NormalizedDict)
+        self.assertEqual(merged, {"a": 1, "b": 20, "c": 3})
+        reflected = {"A": 10, "z": 26} | self.d
+        self.assertIsInstance(reflected, NormalizedDict)
+        self.assertEqual(reflected, {"a": 1, "z": 26, "b": 2})
+        self.d |= {" D ": 4}
+        self.assertEqual(self.d["d"], 4)
+
+    def test_fromkeys(self):
+        d = NormalizedDict.fromkeys([" A ", "B"], 0)
+        self.assertIsInstance(d, NormalizedDict)
+        self.assertEqual(d, {"a": 0, "b": 0})
+
+    def test_normalize_item_str_subclass(self):
+        class Key(StrAutoEnum):
+            UPPER = " Upper "
+
+        for _ in range(2):  # First call normalizes, second is served from the memo
+            normalized = NormalizedDict.normalize_item(Key.UPPER)
+            self.assertIs(type(normalized), str)
+            self.assertEqual(normalized, "upper")
+
     def test_non_string_keys(self):
         with self.assertRaises(TypeError):
             self.d[10] = "number"
         self.assertNotIn(10, self.d)
 
 
+class TestInheritanceMixin(unittest.TestCase):
+    def test_get_parent_items_unions_mro(self):
+        class A(InheritanceMixin):
+            items = {"a"}
+
+        class B(A):
+            items = {"b"}
+
+        class C(B):
+            pass
+
+        self.assertEqual(C.get_parent_items("items"), {"a", "b"})
+        self.assertEqual(C.get_parent_items("items", resolved=True), {"b"})
+
+    def test_get_parent_items_unions_frozensets(self):
+        class A(InheritanceMixin):
+            items = frozenset({"a"})
+
+        class B(A):
+            items = frozenset({"b"})
+
+        class C(B):
+            pass
+
+        self.assertEqual(C.get_parent_items("items"), frozenset({"a", "b"}))
+        self.assertEqual(A.items, frozenset({"a"}))
+
+
 if __name__ == "__main__":
     unittest.main()